@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures.
+"""
+
+import logging
+
+import pytest
+
+from python_redaction_system.core import redaction_engine
+
+
+@pytest.fixture(autouse=True)
+def audit_log_in_tmp_path(tmp_path, monkeypatch):
+    """Write the redaction audit log under tmp_path instead of the working tree."""
+    monkeypatch.setattr(redaction_engine, "AUDIT_LOG_FILE", tmp_path / "logs" / "redaction_audit.log")
+    
+    # The audit logger is shared, so detach the file handlers engines add
+    audit_logger = logging.getLogger("redaction_audit")
+    handlers = list(audit_logger.handlers)
+    yield
+    for handler in audit_logger.handlers[:]:
+        if handler not in handlers:
+            audit_logger.removeHandler(handler)
+            handler.close()
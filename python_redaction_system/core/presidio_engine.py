@@ -36,10 +36,10 @@ class PresidioRedactionEngine:
             logger.info("Successfully initialized Presidio engines")
             
         except ImportError as e:
-            logger.error(f"Failed to import Presidio components: {str(e)}")
+            logger.error("Failed to import Presidio components: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize Presidio engines: {str(e)}")
+            logger.error("Failed to initialize Presidio engines: %s", e)
             raise
     
     def _setup_operators(self):
@@ -105,7 +105,7 @@ class PresidioRedactionEngine:
         try:
             # Simple check - if text is too large, break it into paragraphs
             if len(text) > MAX_TEXT_SIZE:
-                logger.info(f"Large text detected ({len(text)} bytes), processing in chunks")
+                logger.info("Large text detected (%d bytes), processing in chunks", len(text))
                 
                 # Split by paragraphs (simple approach)
                 paragraphs = text.split("\n\n")
@@ -133,7 +133,7 @@ class PresidioRedactionEngine:
                                 for category, count in chunk_stats.items():
                                     total_stats[category] = total_stats.get(category, 0) + count
                             except Exception as e:
-                                logger.error(f"Error processing text chunk: {str(e)}")
+                                logger.error("Error processing text chunk: %s", e)
                                 # On error, keep the original chunk to prevent data loss
                                 redacted_chunks.append(chunk)
                     else:
@@ -146,7 +146,7 @@ class PresidioRedactionEngine:
                             for category, count in paragraph_stats.items():
                                 total_stats[category] = total_stats.get(category, 0) + count
                         except Exception as e:
-                            logger.error(f"Error processing paragraph: {str(e)}")
+                            logger.error("Error processing paragraph: %s", e)
                             # On error, keep the original paragraph to prevent data loss
                             redacted_chunks.append(paragraph)
                 
@@ -158,7 +158,7 @@ class PresidioRedactionEngine:
                 return self._process_text(text, categories)
                 
         except Exception as e:
-            logger.error(f"Error during Presidio redaction: {str(e)}")
+            logger.error("Error during Presidio redaction: %s", e)
             # Return original text on error to prevent data loss
             return text, {}
     
@@ -174,7 +174,7 @@ class PresidioRedactionEngine:
             Tuple of (redacted_text, statistics)
         """
         # Analyze text for PII
-        logger.debug(f"Analyzing text of length {len(text)}")
+        logger.debug("Analyzing text of length %d", len(text))
         results = self.analyzer.analyze(text=text, language="en")
         
         # Filter results by category if specified
@@ -191,7 +191,7 @@ class PresidioRedactionEngine:
         }
         
         # Anonymize text
-        logger.debug(f"Anonymizing text with {len(results)} matches")
+        logger.debug("Anonymizing text with %d matches", len(results))
         anonymized_result = self.anonymizer.anonymize(
             text=text,
             analyzer_results=results,
@@ -204,7 +204,7 @@ class PresidioRedactionEngine:
             category = self._get_category(result.entity_type)
             stats[category] = stats.get(category, 0) + 1
         
-        logger.info(f"Redaction completed. Found {len(results)} matches across {len(stats)} categories")
+        logger.info("Redaction completed. Found %d matches across %d categories", len(results), len(stats))
         return anonymized_result.text, stats
     
     def _get_category(self, entity_type: str) -> str:
@@ -299,5 +299,5 @@ class PresidioRedactionEngine:
             return categorized_results
             
         except Exception as e:
-            logger.error(f"Error during Presidio analysis: {str(e)}")
+            logger.error("Error during Presidio analysis: %s", e)
             return {}
\ No newline at end of file
@@ -17,9 +17,8 @@ from python_redaction_system.core.presidio_engine import PresidioRedactionEngine
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Set up audit logging
+# Audit log location; the directory is created when an engine starts logging
 AUDIT_LOG_DIR = Path("logs")
-AUDIT_LOG_DIR.mkdir(exist_ok=True)
 AUDIT_LOG_FILE = AUDIT_LOG_DIR / "redaction_audit.log"
 
 class RedactionMethod(Enum):
@@ -74,6 +73,10 @@ class RedactionEngine:
         self.sensitivity_level = "medium"  # Default sensitivity level
         self.available_methods = set()
         
+        # (text hash, categories) of the last request Presidio failed on, so
+        # the same request goes straight to the fallbacks next time
+        self._presidio_failure: Optional[Tuple[int, frozenset]] = None
+        
         # Initialize available redaction methods
         self._initialize_redaction_methods()
         
@@ -86,6 +89,7 @@ class RedactionEngine:
         self.audit_logger.setLevel(logging.INFO)
         
         # Create file handler for audit logs
+        AUDIT_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(AUDIT_LOG_FILE)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
@@ -144,11 +148,11 @@ class RedactionEngine:
             self.available_methods.add(RedactionMethod.PRESIDIO)
             logger.info("Successfully initialized Presidio engine")
         except ImportError as e:
-            logger.warning(f"Failed to import Presidio components: {str(e)}")
+            logger.warning("Failed to import Presidio components: %s", e)
             self.presidio_engine = None
             self.use_nlp = False
         except Exception as e:
-            logger.warning(f"Failed to initialize Presidio engine: {str(e)}")
+            logger.warning("Failed to initialize Presidio engine: %s", e)
             self.presidio_engine = None
             self.use_nlp = False
         
@@ -230,13 +234,18 @@ class RedactionEngine:
         
         # Get ordered list of methods to try
         methods = self._get_redaction_methods(preferred_method)
-        logger.info(f"Attempting redaction with methods: {[m.value for m in methods]}")
+        logger.info("Attempting redaction with methods: %s", [m.value for m in methods])
         
         # Try each method in order until one succeeds
         last_error = None
+        request_key = (hash(text), frozenset(categories))
         for method in methods:
+            if method == RedactionMethod.PRESIDIO and self._presidio_failure == request_key:
+                logger.info("Skipping presidio redaction, it already failed for this text")
+                continue
+            
             try:
-                logger.info(f"Trying redaction method: {method.value}")
+                logger.info("Trying redaction method: %s", method.value)
                 
                 if method == RedactionMethod.PRESIDIO:
                     redacted_text, stats = self._redact_with_presidio(text, categories)
@@ -247,7 +256,7 @@ class RedactionEngine:
                 
                 # Simple validation to make sure redaction worked
                 if self._validate_redaction(text, redacted_text):
-                    logger.info(f"Successfully redacted with {method.value}")
+                    logger.info("Successfully redacted with %s", method.value)
                     
                     # Log completion
                     self._log_audit("redaction_complete", {
@@ -255,20 +264,25 @@ class RedactionEngine:
                         "stats": stats
                     })
                     
+                    if method == RedactionMethod.PRESIDIO:
+                        self._presidio_failure = None
+                    
                     return redacted_text, stats
                 else:
-                    logger.warning(f"Validation failed for {method.value} redaction")
+                    logger.warning("Validation failed for %s redaction", method.value)
                     continue
                     
             except Exception as e:
-                logger.error(f"Error with {method.value} redaction: {str(e)}")
+                logger.error("Error with %s redaction: %s", method.value, e)
                 last_error = e
+                if method == RedactionMethod.PRESIDIO:
+                    self._presidio_failure = request_key
                 continue
         
         # If all methods failed, log and return original text to prevent data loss
         logger.error("All redaction methods failed")
         if last_error:
-            logger.error(f"Last error: {str(last_error)}")
+            logger.error("Last error: %s", last_error)
             
         self._log_audit("redaction_failed", {
             "error": str(last_error) if last_error else "Unknown error"
@@ -322,17 +336,15 @@ class RedactionEngine:
         for category, category_rules in rules.items():
             for rule_name, pattern in category_rules.items():
                 try:
-                    # Count matches before redaction
-                    matches = len(re.findall(pattern, redacted_text))
+                    # Redact and count in the same scan
+                    replacement = f"[{category}:{rule_name}]"
+                    redacted_text, matches = re.subn(pattern, replacement, redacted_text)
                     if matches > 0:
-                        # Apply redaction
-                        replacement = f"[{category}:{rule_name}]"
-                        redacted_text = re.sub(pattern, replacement, redacted_text)
                         stats[category] = stats.get(category, 0) + matches
                 except re.error as e:
-                    logger.warning(f"Invalid regex pattern {pattern}: {str(e)}")
+                    logger.warning("Invalid regex pattern %s: %s", pattern, e)
                 except Exception as e:
-                    logger.warning(f"Error applying rule {rule_name}: {str(e)}")
+                    logger.warning("Error applying rule %s: %s", rule_name, e)
         
         return redacted_text, stats
     
@@ -373,14 +385,12 @@ class RedactionEngine:
             if category in basic_patterns:
                 for pattern, replacement in basic_patterns[category]:
                     try:
-                        # Count matches
-                        matches = len(re.findall(pattern, redacted_text))
+                        # Redact and count in the same scan
+                        redacted_text, matches = re.subn(pattern, replacement, redacted_text)
                         if matches > 0:
-                            # Apply redaction
-                            redacted_text = re.sub(pattern, replacement, redacted_text)
                             stats[category] = stats.get(category, 0) + matches
                     except Exception as e:
-                        logger.warning(f"Error applying basic pattern {pattern}: {str(e)}")
+                        logger.warning("Error applying basic pattern %s: %s", pattern, e)
         
         return redacted_text, stats
         
@@ -416,9 +426,9 @@ class RedactionEngine:
                     if matches:
                         category_matches.extend(matches)
                 except re.error as e:
-                    logger.warning(f"Invalid regex pattern {pattern}: {str(e)}")
+                    logger.warning("Invalid regex pattern %s: %s", pattern, e)
                 except Exception as e:
-                    logger.warning(f"Error analyzing with rule {rule_name}: {str(e)}")
+                    logger.warning("Error analyzing with rule %s: %s", rule_name, e)
             
             # Add category to results if matches were found
             if category_matches:
@@ -435,6 +445,6 @@ class RedactionEngine:
                     else:
                         results[category] = matches
             except Exception as e:
-                logger.warning(f"Error during Presidio analysis: {str(e)}")
+                logger.warning("Error during Presidio analysis: %s", e)
         
         return results
\ No newline at end of file
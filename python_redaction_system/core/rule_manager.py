@@ -3,6 +3,7 @@ Rule manager for handling redaction rules and categories.
 """
 
 import re
+import threading
 from typing import Dict, List, Optional, Set
 
 from python_redaction_system.storage.custom_terms import CustomTermsManager
@@ -21,7 +22,17 @@ class RuleManager:
             custom_terms_manager: An instance of CustomTermsManager for custom rules.
                                  If None, built-in rules will be used.
         """
-        self.custom_terms_manager = custom_terms_manager
+        self._custom_terms_manager = custom_terms_manager
+        
+        # Monotonic counter bumped whenever the rule set changes; used to
+        # invalidate the memoized category/rule lookups below.
+        self._version = 0
+        self._categories_cache: Optional[List[str]] = None
+        self._rules_cache: Dict[str, Dict[str, str]] = {}
+        
+        # Redaction reads rules on a worker thread while the UI thread may
+        # change them; lookups built across a change are not memoized
+        self._cache_lock = threading.Lock()
         
         # Preset redaction rules (regex patterns)
         self._preset_rules = {
@@ -72,6 +83,33 @@ class RuleManager:
             "high": ["PII", "PHI", "CREDENTIALS", "WORKPLACE", "FINANCIAL"]
         }
     
+    @property
+    def custom_terms_manager(self) -> Optional[CustomTermsManager]:
+        """The custom terms manager backing custom rules, if any."""
+        return self._custom_terms_manager
+    
+    @custom_terms_manager.setter
+    def custom_terms_manager(self, manager: Optional[CustomTermsManager]) -> None:
+        self._custom_terms_manager = manager
+        self._invalidate_cache()
+    
+    @property
+    def version(self) -> int:
+        """
+        Get the current rule set version.
+        
+        The version increases every time custom rules are added or removed,
+        so callers can use it to detect stale cached data.
+        """
+        return self._version
+    
+    def _invalidate_cache(self) -> None:
+        """Bump the rule set version and drop memoized lookups."""
+        with self._cache_lock:
+            self._version += 1
+            self._categories_cache = None
+            self._rules_cache.clear()
+    
     def get_all_categories(self) -> List[str]:
         """
         Get all available categories of rules.
@@ -79,14 +117,22 @@ class RuleManager:
         Returns:
             A list of category names.
         """
-        preset_categories = set(self._preset_rules.keys())
-        
-        # Add custom categories if custom terms manager is available
-        custom_categories = set()
-        if self.custom_terms_manager:
-            custom_categories = set(self.custom_terms_manager.get_categories())
+        categories = self._categories_cache
+        if categories is None:
+            version = self._version
+            preset_categories = set(self._preset_rules.keys())
+            
+            # Add custom categories if custom terms manager is available
+            custom_categories = set()
+            if self.custom_terms_manager:
+                custom_categories = set(self.custom_terms_manager.get_categories())
+            
+            categories = list(preset_categories.union(custom_categories))
+            with self._cache_lock:
+                if self._version == version:
+                    self._categories_cache = categories
         
-        return list(preset_categories.union(custom_categories))
+        return list(categories)
     
     def get_categories_for_sensitivity(self, sensitivity_level: str) -> List[str]:
         """
@@ -113,6 +159,12 @@ class RuleManager:
         Returns:
             Dictionary of rule names and patterns
         """
+        cached = self._rules_cache.get(category)
+        if cached is not None:
+            return dict(cached)
+        
+        version = self._version
+        
         # Get preset rules
         rules = {}
         if category in self._preset_rules:
@@ -124,7 +176,10 @@ class RuleManager:
             if custom_rules:
                 rules.update(custom_rules)
         
-        return rules
+        with self._cache_lock:
+            if self._version == version:
+                self._rules_cache[category] = rules
+        return dict(rules)
         
     def get_rules_for_categories(self, categories: List[str]) -> Dict[str, Dict[str, str]]:
         """
@@ -165,6 +220,34 @@ class RuleManager:
             raise ValueError(f"Invalid regex pattern: {pattern}")
         
         self.custom_terms_manager.add_term(category, rule_name, pattern)
+        self._invalidate_cache()
+    
+    def add_custom_rules(self, rules: Dict[str, Dict[str, str]]) -> None:
+        """
+        Add many custom redaction rules at once.
+        
+        Every pattern is validated before anything is stored, so an invalid
+        pattern leaves the existing rules untouched.
+        
+        Args:
+            rules: Mapping of categories to rule names and regex patterns
+            
+        Raises:
+            ValueError: If the custom terms manager is unavailable or a pattern is invalid
+        """
+        if not self.custom_terms_manager:
+            raise ValueError("Custom terms manager is not available")
+        
+        # Validate the regex patterns
+        for category_rules in rules.values():
+            for pattern in category_rules.values():
+                try:
+                    re.compile(pattern)
+                except re.error:
+                    raise ValueError(f"Invalid regex pattern: {pattern}")
+        
+        self.custom_terms_manager.add_terms(rules)
+        self._invalidate_cache()
     
     def remove_custom_rule(self, category: str, rule_name: str) -> None:
         """
@@ -180,4 +263,5 @@ class RuleManager:
         if not self.custom_terms_manager:
             raise ValueError("Custom terms manager is not available")
         
-        self.custom_terms_manager.remove_term(category, rule_name)
\ No newline at end of file
+        self.custom_terms_manager.remove_term(category, rule_name)
+        self._invalidate_cache()
\ No newline at end of file
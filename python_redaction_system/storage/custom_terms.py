@@ -2,11 +2,70 @@
 Management of custom redaction terms.
 """
 
+import json
+import threading
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from python_redaction_system.storage.database import DatabaseManager
 
 
+def read_terms_file(file_path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read exported custom terms from a JSON file.
+    
+    Uses orjson for parsing when it is installed and falls back to the
+    standard library json module otherwise.
+    
+    Args:
+        file_path: Path to the JSON file.
+    
+    Returns:
+        A nested dictionary mapping categories to term names and patterns.
+    
+    Raises:
+        ValueError: If the file does not contain a JSON object.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    if orjson is not None:
+        terms = orjson.loads(data)
+    else:
+        terms = json.loads(data.decode('utf-8'))
+    
+    # Validate the structure
+    if not isinstance(terms, dict):
+        raise ValueError("Invalid rule file format. Expected a JSON object.")
+    
+    return terms
+
+
+def write_terms_file(terms: Dict[str, Dict[str, str]], file_path: str) -> None:
+    """
+    Write custom terms to a JSON file.
+    
+    Uses orjson for serialization when it is installed and falls back to the
+    standard library json module otherwise. Both produce two-space indentation
+    and write non-ASCII characters as UTF-8 rather than escapes.
+    
+    Args:
+        terms: A nested dictionary mapping categories to term names and patterns.
+        file_path: Path to the JSON file.
+    """
+    if orjson is not None:
+        data = orjson.dumps(terms, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(terms, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
 class CustomTermsManager:
     """
     Manages custom redaction terms and their persistence in the database.
@@ -20,11 +79,15 @@ class CustomTermsManager:
             db_manager: An instance of DatabaseManager. If None, a new instance will be created.
         """
         self.db_manager = db_manager or DatabaseManager()
+        
+        # Guards the in-memory terms, which redaction reads from a worker
+        # thread while the UI thread may be adding or removing rules
+        self._lock = threading.Lock()
         self._load_terms()
     
     def _load_terms(self) -> None:
         """Load custom terms from the database."""
-        self.terms = {}
+        terms = {}
         
         query = "SELECT category, name, pattern FROM custom_terms"
         results = self.db_manager.execute_query(query)
@@ -34,10 +97,13 @@ class CustomTermsManager:
             name = row["name"]
             pattern = row["pattern"]
             
-            if category not in self.terms:
-                self.terms[category] = {}
+            if category not in terms:
+                terms[category] = {}
             
-            self.terms[category][name] = pattern
+            terms[category][name] = pattern
+        
+        with self._lock:
+            self.terms = terms
     
     def get_categories(self) -> List[str]:
         """
@@ -46,7 +112,8 @@ class CustomTermsManager:
         Returns:
             A list of category names.
         """
-        return list(self.terms.keys())
+        with self._lock:
+            return list(self.terms.keys())
     
     def get_terms_for_category(self, category: str) -> Dict[str, str]:
         """
@@ -56,9 +123,10 @@ class CustomTermsManager:
             category: The category name.
         
         Returns:
-            A dictionary mapping term names to regex patterns.
+            A copy of the dictionary mapping term names to regex patterns.
         """
-        return self.terms.get(category, {})
+        with self._lock:
+            return dict(self.terms.get(category, {}))
     
     def add_term(self, category: str, name: str, pattern: str) -> None:
         """
@@ -80,15 +148,50 @@ class CustomTermsManager:
         self.db_manager.execute_update(query, (category, name, pattern))
         
         # Update in-memory cache
-        if category not in self.terms:
-            self.terms[category] = {}
-        
-        self.terms[category][name] = pattern
+        with self._lock:
+            if category not in self.terms:
+                self.terms[category] = {}
+            
+            self.terms[category][name] = pattern
         
         # Log the action
         details = f"Added/updated custom term '{name}' in category '{category}'"
         self.db_manager.log_audit("system", "add_custom_term", details)
     
+    def add_terms(self, terms: Dict[str, Dict[str, str]]) -> None:
+        """
+        Add many custom terms to the database in one transaction.
+        
+        Args:
+            terms: A nested dictionary mapping categories to term names and patterns.
+        """
+        rows = [
+            (category, name, pattern)
+            for category, category_terms in terms.items()
+            for name, pattern in category_terms.items()
+        ]
+        if not rows:
+            return
+        
+        # Add to database
+        query = '''
+        INSERT INTO custom_terms (category, name, pattern)
+        VALUES (?, ?, ?)
+        ON CONFLICT(category, name) DO UPDATE SET
+        pattern = excluded.pattern
+        '''
+        
+        self.db_manager.execute_many(query, rows)
+        
+        # Update in-memory cache
+        with self._lock:
+            for category, name, pattern in rows:
+                self.terms.setdefault(category, {})[name] = pattern
+        
+        # Log the action
+        details = f"Added/updated {len(rows)} custom terms in {len(terms)} categories"
+        self.db_manager.log_audit("system", "add_custom_terms", details)
+    
     def remove_term(self, category: str, name: str) -> None:
         """
         Remove a custom term from the database and in-memory cache.
@@ -106,12 +209,13 @@ class CustomTermsManager:
         self.db_manager.execute_update(query, (category, name))
         
         # Update in-memory cache
-        if category in self.terms and name in self.terms[category]:
-            del self.terms[category][name]
-            
-            # If the category is now empty, remove it
-            if not self.terms[category]:
-                del self.terms[category]
+        with self._lock:
+            if category in self.terms and name in self.terms[category]:
+                del self.terms[category][name]
+                
+                # If the category is now empty, remove it
+                if not self.terms[category]:
+                    del self.terms[category]
         
         # Log the action
         details = f"Removed custom term '{name}' from category '{category}'"
@@ -133,6 +237,4 @@ class CustomTermsManager:
         Args:
             terms: A nested dictionary of custom terms.
         """
-        for category, category_terms in terms.items():
-            for name, pattern in category_terms.items():
-                self.add_term(category, name, pattern)
\ No newline at end of file
+        self.add_terms(terms)
\ No newline at end of file
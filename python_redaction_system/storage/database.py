@@ -5,7 +5,7 @@ Database management for the redaction system.
 import os
 import platform
 import sqlite3
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from python_redaction_system.config.settings import SettingsManager
 
@@ -155,6 +155,27 @@ class DatabaseManager:
         conn.close()
         return affected_rows
     
+    def execute_many(self, query: str, parameters: Iterable[Tuple]) -> int:
+        """
+        Execute a SQL update query once per parameter tuple in a single transaction.
+        
+        Args:
+            query: The SQL query to execute.
+            parameters: The parameter tuples to pass to the query.
+        
+        Returns:
+            The number of affected rows.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany(query, parameters)
+        conn.commit()
+        affected_rows = cursor.rowcount
+        
+        conn.close()
+        return affected_rows
+    
     def log_redaction(self, user_id: str, categories: List[str], 
                      redaction_count: int, text_hash: str) -> None:
         """
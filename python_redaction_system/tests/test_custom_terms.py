@@ -0,0 +1,41 @@
+"""
+Tests for custom term storage.
+"""
+
+import json
+
+import pytest
+
+from python_redaction_system.storage.custom_terms import read_terms_file, write_terms_file
+
+
+class TestTermsFiles:
+    """Tests for reading and writing exported custom terms."""
+    
+    def test_read_terms_file(self, tmp_path):
+        """Test that an exported terms file is parsed into nested dicts."""
+        terms = {"CUSTOM": {"PROJECT": r"Project\s+X"}}
+        file_path = tmp_path / "rules.json"
+        file_path.write_text(json.dumps(terms), encoding="utf-8")
+        
+        assert read_terms_file(str(file_path)) == terms
+    
+    def test_read_terms_file_rejects_non_objects(self, tmp_path):
+        """Test that a terms file must contain a JSON object."""
+        file_path = tmp_path / "rules.json"
+        file_path.write_text("[1, 2, 3]", encoding="utf-8")
+        
+        with pytest.raises(ValueError):
+            read_terms_file(str(file_path))
+    
+    def test_write_terms_file_round_trip(self, tmp_path):
+        """Test that written terms read back unchanged."""
+        terms = {"CUSTOM": {"PROJECT": r"Project\s+X", "CAFE": "café"}}
+        file_path = tmp_path / "rules.json"
+        
+        write_terms_file(terms, str(file_path))
+        
+        # Non-ASCII is written as UTF-8 whether or not orjson is installed
+        assert '"café"' in file_path.read_text(encoding="utf-8")
+        assert json.loads(file_path.read_text(encoding="utf-8")) == terms
+        assert read_terms_file(str(file_path)) == terms
@@ -4,7 +4,7 @@ Tests for the redaction engine.
 
 import pytest
 
-from python_redaction_system.core.redaction_engine import RedactionEngine
+from python_redaction_system.core.redaction_engine import RedactionEngine, RedactionMethod
 from python_redaction_system.core.rule_manager import RuleManager
 
 
@@ -71,4 +71,39 @@ class TestRedactionEngine:
         # Check that analysis contains the sensitive information
         assert "PII" in analysis
         assert "555-123-4567" in str(analysis["PII"])
-        assert "john.doe@example.com" in str(analysis["PII"])
\ No newline at end of file
+        assert "john.doe@example.com" in str(analysis["PII"])
+    
+    def test_presidio_failure_is_not_retried(self, engine):
+        """Test that a request Presidio failed on skips Presidio the next time."""
+        calls = []
+        
+        def failing_presidio(text, categories):
+            calls.append(text)
+            raise RuntimeError("NLP pipeline failed")
+        
+        engine.available_methods.add(RedactionMethod.PRESIDIO)
+        engine._redact_with_presidio = failing_presidio
+        
+        text = "My SSN is 123-45-6789"
+        first, _ = engine.redact_text(text, ["PII"])
+        second, _ = engine.redact_text(text, ["PII"])
+        
+        assert calls == [text]
+        assert first == second
+        
+        # A different request gets another Presidio attempt
+        engine.redact_text("Another SSN: 987-65-4321", ["PII"])
+        assert len(calls) == 2
+    
+    def test_rules_apply_in_category_order(self, engine):
+        """Test that an earlier category's rule wins where rules overlap."""
+        redacted_text, _ = engine._redact_with_rules("Bank Account: 987654321", ["CREDENTIALS", "FINANCIAL"])
+        
+        assert redacted_text == "Bank [CREDENTIALS:USERNAME]"
+    
+    def test_basic_redaction_counts_each_match(self, engine):
+        """Test that the last-resort redaction counts every replaced match."""
+        redacted_text, stats = engine._redact_basic("SSN 123-45-6789 and 987-65-4321", ["PII"])
+        
+        assert redacted_text == "SSN [PII:SSN] and [PII:SSN]"
+        assert stats == {"PII": 2}
@@ -0,0 +1,92 @@
+"""
+Tests for the rule manager.
+"""
+
+import pytest
+
+from python_redaction_system.config.settings import SettingsManager
+from python_redaction_system.core.rule_manager import RuleManager
+from python_redaction_system.storage.custom_terms import CustomTermsManager
+from python_redaction_system.storage.database import DatabaseManager
+
+
+class TestRuleManager:
+    """Tests for the RuleManager class."""
+    
+    @pytest.fixture
+    def rule_manager(self, tmp_path):
+        """Create a RuleManager backed by a temporary database."""
+        settings_manager = SettingsManager(config_path=str(tmp_path / "settings.json"))
+        settings_manager.set("database_path", str(tmp_path / "redaction.db"))
+        db_manager = DatabaseManager(settings_manager)
+        return RuleManager(CustomTermsManager(db_manager))
+    
+    def test_custom_rule_changes_bump_version(self, rule_manager):
+        """Test that adding and removing custom rules invalidates cached lookups."""
+        initial_version = rule_manager.version
+        assert "CUSTOM" not in rule_manager.get_all_categories()
+        
+        rule_manager.add_custom_rule("CUSTOM", "PROJECT", r"Project X")
+        
+        assert rule_manager.version > initial_version
+        assert "CUSTOM" in rule_manager.get_all_categories()
+        assert rule_manager.get_rules_for_category("CUSTOM") == {"PROJECT": r"Project X"}
+        
+        added_version = rule_manager.version
+        rule_manager.remove_custom_rule("CUSTOM", "PROJECT")
+        
+        assert rule_manager.version > added_version
+        assert "CUSTOM" not in rule_manager.get_all_categories()
+        assert rule_manager.get_rules_for_category("CUSTOM") == {}
+    
+    def test_rules_read_during_a_change_are_not_cached(self, rule_manager, monkeypatch):
+        """Test that a lookup overlapping a rule change does not memoize stale rules."""
+        terms_manager = rule_manager.custom_terms_manager
+        read_terms = terms_manager.get_terms_for_category
+        
+        def read_then_change(category):
+            # Another thread adds a rule after this lookup read the old terms
+            terms = read_terms(category)
+            monkeypatch.setattr(terms_manager, "get_terms_for_category", read_terms)
+            rule_manager.add_custom_rule("CUSTOM", "PROJECT", r"Project X")
+            return terms
+        
+        monkeypatch.setattr(terms_manager, "get_terms_for_category", read_then_change)
+        
+        assert rule_manager.get_rules_for_category("CUSTOM") == {}
+        assert rule_manager.get_rules_for_category("CUSTOM") == {"PROJECT": r"Project X"}
+    
+    def test_add_custom_rules(self, rule_manager):
+        """Test that rules added in bulk are stored and visible."""
+        initial_version = rule_manager.version
+        
+        rule_manager.add_custom_rules({
+            "CUSTOM": {"PROJECT": r"Project X", "CODE": r"\bX-\d+\b"},
+            "OTHER": {"TEAM": r"Team Blue"},
+        })
+        
+        assert rule_manager.version > initial_version
+        assert rule_manager.get_rules_for_category("CUSTOM") == {
+            "PROJECT": r"Project X", "CODE": r"\bX-\d+\b"
+        }
+        assert rule_manager.get_rules_for_category("OTHER") == {"TEAM": r"Team Blue"}
+        
+        # The rules were persisted, not just cached
+        reloaded = CustomTermsManager(rule_manager.custom_terms_manager.db_manager)
+        assert reloaded.get_terms_for_category("CUSTOM") == {
+            "PROJECT": r"Project X", "CODE": r"\bX-\d+\b"
+        }
+    
+    def test_add_custom_rules_rejects_invalid_pattern(self, rule_manager):
+        """Test that one invalid pattern prevents the whole batch from being stored."""
+        with pytest.raises(ValueError):
+            rule_manager.add_custom_rules({"CUSTOM": {"GOOD": r"good", "BAD": r"(unclosed"}})
+        
+        assert "CUSTOM" not in rule_manager.get_all_categories()
+    
+    def test_cached_rules_are_not_shared(self, rule_manager):
+        """Test that mutating a returned rule dict does not corrupt the cache."""
+        rules = rule_manager.get_rules_for_category("PII")
+        rules["BOGUS"] = r"bogus"
+        
+        assert "BOGUS" not in rule_manager.get_rules_for_category("PII")
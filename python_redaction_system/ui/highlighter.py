@@ -0,0 +1,105 @@
+"""
+Syntax highlighter that colors redaction markers in the output view.
+"""
+
+import re
+from typing import Dict, FrozenSet, List
+
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+
+# Highlight colors for redaction markers of each category
+CATEGORY_COLORS = {
+    "PII": "#ff5555",       # Red
+    "PHI": "#5555ff",       # Blue
+    "FINANCIAL": "#55aa55", # Green
+    "CREDENTIALS": "#aa55aa", # Purple
+    "WORKPLACE": "#aaaa55",  # Yellow
+    "LOCATIONS": "#55aaaa"  # Teal
+}
+
+# Color for markers of categories without an entry in CATEGORY_COLORS
+DEFAULT_CATEGORY_COLOR = "#aaaaaa"  # Gray
+
+# Any marker like [PII:SSN]; the category is checked against the selection
+# after matching, which keeps the pattern a single literal-prefixed branch
+_MARKER_PATTERN = re.compile(r'\[([^\[\]:]+):[^\]]+\]')
+
+
+class RedactionHighlighter(QSyntaxHighlighter):
+    """
+    Colors markers like [PII:SSN] block by block.
+    
+    Formats are applied as a layout overlay, so the document text stays plain
+    and Qt only re-runs highlightBlock for blocks that change.
+    """
+    
+    def __init__(self, document: QTextDocument):
+        """
+        Initialize the highlighter.
+        
+        Args:
+            document: The document to highlight.
+        """
+        super().__init__(document)
+        self._enabled = True
+        self._categories: FrozenSet[str] = frozenset()
+        self._formats: Dict[str, QTextCharFormat] = {}
+    
+    def set_categories(self, categories: List[str]) -> None:
+        """
+        Set the categories whose markers are highlighted.
+        
+        Call this before replacing the document text so the new blocks are
+        highlighted with the new selection.
+        
+        Args:
+            categories: The redaction categories to highlight.
+        """
+        self._categories = frozenset(categories)
+    
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Turn highlighting on or off and refresh the document.
+        
+        Args:
+            enabled: Whether markers should be highlighted.
+        """
+        if enabled != self._enabled:
+            self._enabled = enabled
+            self.rehighlight()
+    
+    def _format_for(self, category: str) -> QTextCharFormat:
+        """
+        Get the cached character format for a category's markers.
+        
+        Args:
+            category: The redaction category.
+        
+        Returns:
+            The format to apply to the category's markers.
+        """
+        char_format = self._formats.get(category)
+        if char_format is None:
+            char_format = QTextCharFormat()
+            char_format.setBackground(QColor(CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)))
+            char_format.setForeground(QColor("white"))
+            char_format.setFontWeight(QFont.Weight.Bold)
+            self._formats[category] = char_format
+        return char_format
+    
+    def highlightBlock(self, text: str) -> None:
+        """
+        Highlight the redaction markers in a single block.
+        
+        Args:
+            text: The text of the block.
+        """
+        # The substring test runs in C and rules out most blocks of a long
+        # output before the regex engine is involved
+        if not self._enabled or not self._categories or '[' not in text:
+            return
+        
+        for match in _MARKER_PATTERN.finditer(text):
+            category = match.group(1)
+            if category in self._categories:
+                self.setFormat(match.start(), match.end() - match.start(), self._format_for(category))
@@ -3,25 +3,81 @@ Main window for the PySide6-based redaction system UI.
 """
 
 from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
+import csv
 import re
+import html
+import mmap
 import platform
 import sys
 import logging
 import traceback
 
-from PySide6.QtCore import Qt, Slot, QTimer
-from PySide6.QtGui import QPalette, QColor, QTextCharFormat, QTextCursor, QFont, QIcon
+from PySide6.QtCore import (
+    Qt, Slot, QTimer, QSortFilterProxyModel, QAbstractTableModel, QModelIndex,
+    QThreadPool
+)
+from PySide6.QtGui import QPalette, QFont, QIcon
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QPushButton, QLabel, QComboBox, QGroupBox, QSplitter,
+    QTextEdit, QPlainTextEdit, QPushButton, QLabel, QComboBox, QGroupBox, QSplitter,
     QCheckBox, QTabWidget, QFileDialog, QMessageBox, QProgressBar,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QTableWidget, QTableWidgetItem, QHeaderView, QTableView, QFormLayout,
+    QLineEdit, QRadioButton, QButtonGroup, QInputDialog, QScrollArea
 )
 
 from python_redaction_system.core.redaction_engine import RedactionEngine, RedactionMethod
 from python_redaction_system.core.rule_manager import RuleManager
-from python_redaction_system.storage.custom_terms import CustomTermsManager
+from python_redaction_system.storage.custom_terms import (
+    CustomTermsManager, read_terms_file, write_terms_file
+)
+from python_redaction_system.storage.database import DatabaseManager
 from python_redaction_system.config.settings import SettingsManager
+from python_redaction_system.ui.highlighter import RedactionHighlighter
+from python_redaction_system.ui.workers import Worker
+
+# The platform cannot change while the application is running
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Number of compiled patterns the rule tester keeps before starting over
+_TEST_REGEX_CACHE_SIZE = 64
+
+# Number of recent redaction results kept for repeated runs on the same input
+_REDACT_CACHE_SIZE = 8
+
+# Placeholder shown in the empty output view, and while a redaction runs
+_OUTPUT_PLACEHOLDER = "Redacted text will appear here..."
+_OUTPUT_BUSY_PLACEHOLDER = "Redacting..."
+
+# Buffer size for writing saved output, which arrives one block at a time
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Applied to each block's text so saved output matches toPlainText(), which
+# turns line/paragraph separators into newlines and non-breaking spaces into spaces
+_PLAIN_TEXT_TABLE = str.maketrans({'\u2028': '\n', '\u2029': '\n', '\u00a0': ' '})
+
+
+def _read_text_file(file_path: str) -> str:
+    """
+    Read a UTF-8 text file through a read-only memory map.
+    
+    Args:
+        file_path: Path to the file.
+        
+    Returns:
+        The decoded text with line endings normalized to '\\n'.
+    """
+    with open(file_path, 'rb') as f:
+        # mmap refuses zero-length files
+        if f.seek(0, 2) == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    
+    # Match what open() in text mode did before
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 class MainWindow(QMainWindow):
@@ -29,6 +85,9 @@ class MainWindow(QMainWindow):
     Main application window for the redaction system.
     """
 
+    # Shared Windows UI font, created on first use since QFont needs a QApplication
+    _windows_font: Optional[QFont] = None
+
     def __init__(self, redaction_engine: Optional[RedactionEngine] = None,
                  settings_manager: Optional[SettingsManager] = None):
         """
@@ -44,6 +103,23 @@ class MainWindow(QMainWindow):
         self.redaction_engine = redaction_engine or RedactionEngine()
         self.settings_manager = settings_manager or SettingsManager()
         
+        # Lazily created storage managers for custom rules
+        self._db_manager: Optional[DatabaseManager] = None
+        self._custom_terms_manager: Optional[CustomTermsManager] = None
+        
+        # Patterns compiled by the rule form (testing and adding rules)
+        self._test_regex_cache: Dict[str, re.Pattern] = {}
+        
+        # Input text as of the last read, with the document revision it came from
+        self._cached_input: Tuple[str, int] = ("", -1)
+        
+        # Id of the latest redaction request; older results are discarded
+        self._redact_request_id = 0
+        self._redact_worker: Optional[Worker] = None
+        
+        # Recent redaction results, most recently used last
+        self._redact_cache: OrderedDict[tuple, Tuple[str, Dict[str, int]]] = OrderedDict()
+        
         # Statistics for redactions
         self.redaction_stats = {}
         
@@ -51,9 +127,11 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Text Redaction System")
         
         # Set Windows-specific window size and font
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
+            if MainWindow._windows_font is None:
+                MainWindow._windows_font = QFont('Segoe UI', 9)
             self.resize(1200, 900)  # Slightly larger default size for Windows
-            self.setFont(QFont('Segoe UI', 9))
+            self.setFont(MainWindow._windows_font)
         else:
             self.resize(1000, 800)
         
@@ -85,26 +163,38 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
+        # Create tabs; only the redaction tab is filled in up front, the
+        # others are built the first time they are shown
         redaction_tab = QWidget()
         rule_management_tab = QWidget()
         statistics_tab = QWidget()
         
         self._create_redaction_tab(redaction_tab)
-        self._create_rule_management_tab(rule_management_tab)
-        self._create_statistics_tab(statistics_tab)
+        self._tab_builders = [None, self._create_rule_management_tab, self._create_statistics_tab]
+        self._tabs_built = [True, False, False]
         
         # Add tabs to tab widget
         self.tab_widget.addTab(redaction_tab, "Redaction")
         self.tab_widget.addTab(rule_management_tab, "Rule Management")
         self.tab_widget.addTab(statistics_tab, "Statistics")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # Add status bar
         self.status_label = QLabel("Ready")
         self.statusBar().addPermanentWidget(self.status_label)
+    
+    def _ensure_tab_built(self, index: int) -> None:
+        """
+        Build a tab's contents the first time it is needed.
         
-        # Load settings
-        self._load_settings()
+        Args:
+            index: The index of the tab in the tab widget.
+        """
+        if index < 0 or self._tabs_built[index]:
+            return
+        
+        self._tabs_built[index] = True
+        self._tab_builders[index](self.tab_widget.widget(index))
     
     def _create_redaction_tab(self, tab_widget: QWidget) -> None:
         """
@@ -128,7 +218,9 @@ class MainWindow(QMainWindow):
         input_group = QGroupBox("Input Text")
         input_layout = QVBoxLayout(input_group)
         
-        self.text_input = QTextEdit()
+        # Plain text editor: input is only ever read as plain text, and its
+        # block-by-block layout keeps loading large files responsive
+        self.text_input = QPlainTextEdit()
         self.text_input.setPlaceholderText("Enter or paste text to redact...")
         input_layout.addWidget(self.text_input)
         
@@ -175,13 +267,18 @@ class MainWindow(QMainWindow):
         category_label.setFixedWidth(120)
         category_layout.addWidget(category_label)
         
-        # Category checkboxes
+        # Category checkboxes, with the checked ones tracked as they toggle
         self.category_checkboxes = {}
+        self._selected_categories = set()
         category_checkbox_layout = QHBoxLayout()
         
         for category in self.redaction_engine.rule_manager.get_all_categories():
             checkbox = QCheckBox(category)
             checkbox.setChecked(True)  # Default to checked
+            self._selected_categories.add(category)
+            checkbox.toggled.connect(
+                lambda checked, category=category: self._set_category_selected(category, checked)
+            )
             self.category_checkboxes[category] = checkbox
             category_checkbox_layout.addWidget(checkbox)
         
@@ -235,9 +332,13 @@ class MainWindow(QMainWindow):
         output_group = QGroupBox("Redacted Output")
         output_layout = QVBoxLayout(output_group)
         
-        self.text_output = QTextEdit()
+        # Plain text document: the output is never rich text, and markers are
+        # colored by the highlighter as a per-block overlay
+        self.text_output = QPlainTextEdit()
         self.text_output.setReadOnly(True)
-        self.text_output.setPlaceholderText("Redacted text will appear here...")
+        self.text_output.setPlaceholderText(_OUTPUT_PLACEHOLDER)
+        self.text_output.setUndoRedoEnabled(False)
+        self.output_highlighter = RedactionHighlighter(self.text_output.document())
         output_layout.addWidget(self.text_output)
         
         # Output buttons
@@ -276,13 +377,6 @@ class MainWindow(QMainWindow):
         Args:
             tab_widget: The widget to add components to.
         """
-        from PySide6.QtCore import QSortFilterProxyModel, QAbstractTableModel, Qt, QModelIndex
-        from PySide6.QtGui import QFont
-        from PySide6.QtWidgets import (QTableView, QHeaderView, QSplitter, QFormLayout, 
-                                    QComboBox, QLineEdit, QGroupBox, QRadioButton,
-                                    QButtonGroup, QPushButton, QFileDialog, QMessageBox,
-                                    QInputDialog, QScrollArea)
-        
         layout = QVBoxLayout(tab_widget)
         
         # Create a horizontal splitter for rules table and form
@@ -312,49 +406,140 @@ class MainWindow(QMainWindow):
                 super().__init__(parent)
                 self.rule_manager = rule_manager
                 self.categories = rule_manager.get_all_categories()
-                self.rules_data = []
+                
+                # Column-oriented storage: one list per column instead of a
+                # dict per row keeps data() to plain list indexing
+                self._categories = []
+                self._names = []
+                self._patterns = []
+                self._is_custom = []
+                self._custom_labels = []
+                
+                # Lowercased text of every column per row, for search
+                self._haystacks = []
+                
+                # Font returned for custom rules, built once instead of per
+                # cell; built-in rules return no font and use the view's own
+                self._bold_font = QFont()
+                self._bold_font.setBold(True)
+                
                 self._refresh_data()
                 
             def _refresh_data(self):
-                self.rules_data = []
+                categories, names, patterns, is_custom = [], [], [], []
+                preset_rules = self.rule_manager._preset_rules
                 for category in self.categories:
+                    # Look up the category's built-in names once, not per rule
+                    preset_names = frozenset(preset_rules.get(category, ()))
                     rules = self.rule_manager.get_rules_for_category(category)
                     for rule_name, pattern in rules.items():
-                        self.rules_data.append({
-                            "category": category,
-                            "name": rule_name,
-                            "pattern": pattern,
-                            "is_custom": rule_name not in self.rule_manager._preset_rules.get(category, {})
-                        })
-                self.layoutChanged.emit()
+                        categories.append(category)
+                        names.append(rule_name)
+                        patterns.append(pattern)
+                        is_custom.append(rule_name not in preset_names)
+                
+                custom_labels = ["Custom" if custom else "Built-in" for custom in is_custom]
+                haystacks = [
+                    self._haystack(*row) for row in zip(categories, names, patterns, custom_labels)
+                ]
+                
+                # Swap the columns in as one model reset, so views and the
+                # proxy rebuild once and drop any stale row indexes
+                self.beginResetModel()
+                self._categories = categories
+                self._names = names
+                self._patterns = patterns
+                self._is_custom = is_custom
+                self._custom_labels = custom_labels
+                self._haystacks = haystacks
+                self.endResetModel()
+            
+            @staticmethod
+            def _haystack(category, rule_name, pattern, custom_label):
+                return "\x1f".join((category, rule_name, pattern, custom_label)).lower()
+            
+            def add_rule(self, category, rule_name, pattern, is_custom):
+                """Insert or update a single rule without rebuilding the table."""
+                if category not in self.categories:
+                    # A new category changes the category order, rebuild once
+                    self.refresh()
+                    return
+                
+                row = self._find_row(category, rule_name)
+                if row is not None:
+                    self._patterns[row] = pattern
+                    self._haystacks[row] = self._haystack(
+                        category, rule_name, pattern, self._custom_labels[row])
+                    self.dataChanged.emit(self.index(row, 2), self.index(row, 2))
+                    return
+                
+                # Rows are grouped by category, new rules go after the last one
+                row = len(self._categories)
+                while row > 0 and self._categories[row - 1] != category:
+                    row -= 1
+                if row == 0:
+                    row = len(self._categories)
+                
+                custom_label = "Custom" if is_custom else "Built-in"
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._categories.insert(row, category)
+                self._names.insert(row, rule_name)
+                self._patterns.insert(row, pattern)
+                self._is_custom.insert(row, is_custom)
+                self._custom_labels.insert(row, custom_label)
+                self._haystacks.insert(row, self._haystack(category, rule_name, pattern, custom_label))
+                self.endInsertRows()
+            
+            def remove_rule(self, category, rule_name):
+                """Remove a single rule without rebuilding the table."""
+                row = self._find_row(category, rule_name)
+                if row is None:
+                    return
+                
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._categories[row]
+                del self._names[row]
+                del self._patterns[row]
+                del self._is_custom[row]
+                del self._custom_labels[row]
+                del self._haystacks[row]
+                self.endRemoveRows()
+                
+                if category not in self._categories:
+                    self.categories = [c for c in self.categories if c != category]
+            
+            def _find_row(self, category, rule_name):
+                for row, name in enumerate(self._names):
+                    if name == rule_name and self._categories[row] == category:
+                        return row
+                return None
+            
+            def matches(self, row, needle):
+                """Return whether a row contains the lowercased search text."""
+                return needle in self._haystacks[row]
+            
+            def rule_at(self, row):
+                """Return (category, name, pattern, is_custom) for a row."""
+                return (self._categories[row], self._names[row],
+                        self._patterns[row], self._is_custom[row])
                 
             def rowCount(self, parent=QModelIndex()):
-                return len(self.rules_data)
+                return len(self._names)
                 
             def columnCount(self, parent=QModelIndex()):
                 return 4  # Category, Name, Pattern, Is Custom
                 
             def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-                if not index.isValid() or index.row() >= len(self.rules_data):
+                row = index.row()
+                if not index.isValid() or row >= len(self._names):
                     return None
-                    
-                rule = self.rules_data[index.row()]
                 
                 if role == Qt.ItemDataRole.DisplayRole:
-                    if index.column() == 0:
-                        return rule["category"]
-                    elif index.column() == 1:
-                        return rule["name"]
-                    elif index.column() == 2:
-                        return rule["pattern"]
-                    elif index.column() == 3:
-                        return "Custom" if rule["is_custom"] else "Built-in"
+                    return (self._categories, self._names,
+                            self._patterns, self._custom_labels)[index.column()][row]
                 
                 elif role == Qt.ItemDataRole.FontRole:
-                    font = QFont()
-                    if rule["is_custom"]:
-                        font.setBold(True)
-                    return font
+                    return self._bold_font if self._is_custom[row] else None
                     
                 return None
                 
@@ -368,17 +553,35 @@ class MainWindow(QMainWindow):
                 self.categories = self.rule_manager.get_all_categories()
                 self._refresh_data()
         
-        # Create filter proxy model for search
+        # Filter proxy - inner class. Rows are matched against the model's
+        # precomputed lowercase text instead of fetching every cell through
+        # data() on each filter pass
+        class RuleFilterProxyModel(QSortFilterProxyModel):
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                self._needle = ""
+                
+            def set_search_text(self, text):
+                self._needle = text.lower()
+                self.invalidateFilter()
+                
+            def filterAcceptsRow(self, source_row, source_parent):
+                return not self._needle or self.sourceModel().matches(source_row, self._needle)
+        
+        # Create filter proxy model for search (case-insensitive, all columns)
         self.rules_model = RuleTableModel(self, self.redaction_engine.rule_manager)
-        self.rules_proxy_model = QSortFilterProxyModel()
+        self.rules_proxy_model = RuleFilterProxyModel()
         self.rules_proxy_model.setSourceModel(self.rules_model)
-        self.rules_proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.rules_proxy_model.setFilterKeyColumn(-1)  # Search all columns
         
         self.rules_table.setModel(self.rules_proxy_model)
         
-        # Connect search box to filter model
-        self.rule_search.textChanged.connect(self.rules_proxy_model.setFilterFixedString)
+        # Connect search box to filter model, debounced so rapid typing
+        # only triggers a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_rule_filter)
+        self.rule_search.textChanged.connect(lambda _text: self._filter_timer.start())
         
         # Set column stretching
         self.rules_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -421,6 +624,7 @@ class MainWindow(QMainWindow):
         self.category_combo.setEditable(True)
         self.category_combo.setInsertPolicy(QComboBox.InsertPolicy.InsertAlphabetically)
         self._refresh_category_combo()
+        self.category_combo.currentIndexChanged.connect(self._handle_category_selection)
         rule_form_layout.addRow("Category:", self.category_combo)
         
         # Rule name field
@@ -492,6 +696,30 @@ class MainWindow(QMainWindow):
         splitter.addWidget(right_widget)
         splitter.setSizes([400, 400])  # Set initial sizes
     
+    def _apply_rule_filter(self) -> None:
+        """Apply the current search text to the rules table filter."""
+        self.rules_proxy_model.set_search_text(self.rule_search.text())
+    
+    def _refresh_rules_silently(self) -> None:
+        """Refresh the rules model with table repaints suspended until it is done."""
+        # Fit-to-contents columns measure every row on each layout change, so
+        # hold them fixed during the rebuild and size them once afterwards
+        header = self.rules_table.horizontalHeader()
+        fitted_columns = [
+            column for column in range(header.count())
+            if header.sectionResizeMode(column) == QHeaderView.ResizeMode.ResizeToContents
+        ]
+        self.rules_table.setUpdatesEnabled(False)
+        for column in fitted_columns:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+        try:
+            self.rules_model.refresh()
+        finally:
+            for column in fitted_columns:
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+            self.rules_table.setUpdatesEnabled(True)
+            self.rules_table.viewport().update()
+    
     def _refresh_category_combo(self) -> None:
         """Refresh the category dropdown with current categories."""
         # Store current selection
@@ -513,11 +741,9 @@ class MainWindow(QMainWindow):
             if index >= 0:
                 self.category_combo.setCurrentIndex(index)
                 
-        # Re-enable signals and connect handler
+        # Re-enable signals; the selection handler is connected once when
+        # the combo is created
         self.category_combo.blockSignals(False)
-        
-        # Make sure we're connected to the handler
-        self.category_combo.currentIndexChanged.connect(self._handle_category_selection)
     
     def _handle_category_selection(self, index: int) -> None:
         """Handle selection in the category dropdown."""
@@ -559,7 +785,6 @@ class MainWindow(QMainWindow):
             return
         
         # Convert plain text to regex if needed
-        import re
         if not is_regex:
             # Escape special regex characters
             pattern = re.escape(pattern_text)
@@ -568,7 +793,7 @@ class MainWindow(QMainWindow):
             
             # Validate regex
             try:
-                re.compile(pattern)
+                self._compile_pattern(pattern)
             except re.error as e:
                 QMessageBox.critical(self, "Invalid Regex", f"The regular expression is invalid: {str(e)}")
                 return
@@ -576,19 +801,15 @@ class MainWindow(QMainWindow):
         # Add the rule
         try:
             # Make sure custom terms manager is initialized
-            if not self.redaction_engine.rule_manager.custom_terms_manager:
-                from python_redaction_system.storage.custom_terms import CustomTermsManager
-                from python_redaction_system.storage.database import DatabaseManager
-                
-                db_manager = DatabaseManager()
-                custom_terms_manager = CustomTermsManager(db_manager)
-                self.redaction_engine.rule_manager.custom_terms_manager = custom_terms_manager
+            self._ensure_custom_terms_manager()
             
             # Add the rule
-            self.redaction_engine.rule_manager.add_custom_rule(category, rule_name, pattern)
+            rule_manager = self.redaction_engine.rule_manager
+            rule_manager.add_custom_rule(category, rule_name, pattern)
             
-            # Refresh the table
-            self.rules_model.refresh()
+            # Update only the affected row of the table
+            is_custom = rule_name not in rule_manager._preset_rules.get(category, {})
+            self.rules_model.add_rule(category, rule_name, pattern, is_custom)
             
             # Clear the form
             self.rule_name_edit.clear()
@@ -600,6 +821,24 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error adding rule: {str(e)}")
     
+    def _ensure_custom_terms_manager(self) -> CustomTermsManager:
+        """
+        Make sure the rule manager has a custom terms manager.
+        
+        The database and custom terms managers are created at most once per
+        window and reused for every subsequent rule change.
+        
+        Returns:
+            The custom terms manager used by the rule manager.
+        """
+        rule_manager = self.redaction_engine.rule_manager
+        if not rule_manager.custom_terms_manager:
+            if self._custom_terms_manager is None:
+                self._db_manager = DatabaseManager(self.settings_manager)
+                self._custom_terms_manager = CustomTermsManager(self._db_manager)
+            rule_manager.custom_terms_manager = self._custom_terms_manager
+        return rule_manager.custom_terms_manager
+    
     def _delete_selected_rule(self) -> None:
         """Delete the selected rule from the table."""
         # Get the selected row
@@ -613,10 +852,7 @@ class MainWindow(QMainWindow):
         source_index = self.rules_proxy_model.mapToSource(proxy_index)
         row = source_index.row()
         
-        rule_data = self.rules_model.rules_data[row]
-        category = rule_data["category"]
-        rule_name = rule_data["name"]
-        is_custom = rule_data["is_custom"]
+        category, rule_name, _, is_custom = self.rules_model.rule_at(row)
         
         # Confirm deletion
         if not is_custom:
@@ -634,8 +870,8 @@ class MainWindow(QMainWindow):
                 # Delete the rule
                 self.redaction_engine.rule_manager.remove_custom_rule(category, rule_name)
                 
-                # Refresh the table
-                self.rules_model.refresh()
+                # Remove only the affected row from the table
+                self.rules_model.remove_rule(category, rule_name)
                 
                 # Update status
                 self.status_label.setText(f"Rule '{rule_name}' deleted.")
@@ -643,6 +879,29 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error deleting rule: {str(e)}")
     
+    def _compile_pattern(self, pattern: str) -> re.Pattern:
+        """
+        Compile a pattern from the rule form, reusing earlier compilations.
+        
+        Testing a rule and then adding it compiles the same pattern only once.
+        
+        Args:
+            pattern: The regular expression to compile.
+        
+        Returns:
+            The compiled pattern.
+        
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
+        """
+        regex = self._test_regex_cache.get(pattern)
+        if regex is None:
+            if len(self._test_regex_cache) >= _TEST_REGEX_CACHE_SIZE:
+                self._test_regex_cache.clear()
+            regex = re.compile(pattern)
+            self._test_regex_cache[pattern] = regex
+        return regex
+    
     def _test_rule(self) -> None:
         """Test the current pattern against the sample text."""
         pattern_text = self.pattern_edit.toPlainText().strip()
@@ -658,7 +917,6 @@ class MainWindow(QMainWindow):
             return
         
         # Convert plain text to regex if needed
-        import re
         if not is_regex:
             # Escape special regex characters
             pattern = re.escape(pattern_text)
@@ -667,38 +925,38 @@ class MainWindow(QMainWindow):
         
         # Test the pattern
         try:
-            regex = re.compile(pattern)
-            matches = regex.findall(test_text)
+            regex = self._compile_pattern(pattern)
             
-            # Highlight matches in the test text
-            highlighted_text = test_text
-            for match in matches:
-                # If match is a tuple (from capturing groups), use the whole match
-                if isinstance(match, tuple):
-                    match = match[0]
-                
-                # Highlight by replacing with HTML
-                highlighted_text = highlighted_text.replace(
-                    match, f'<span style="background-color: yellow; color: black;">{match}</span>'
-                )
+            # Collect the matches and the highlighted text in one pass.
+            # group(0) is the whole match even when the pattern contains
+            # capturing groups, and everything from the sample is escaped
+            # so it shows up literally in the HTML view
+            matches = []
+            highlighted = []
+            last = 0
+            for match in regex.finditer(test_text):
+                matched = html.escape(match.group(0))
+                matches.append(matched)
+                highlighted.append(html.escape(test_text[last:match.start()]))
+                highlighted.append(f'<span style="background-color: yellow; color: black;">{matched}</span>')
+                last = match.end()
+            highlighted.append(html.escape(test_text[last:]))
             
             # Display results
             if matches:
-                result_text = f"<h3>Found {len(matches)} matches:</h3>"
-                result_text += "<ul>"
+                result = [f"<h3>Found {len(matches)} matches:</h3>", "<ul>"]
                 for i, match in enumerate(matches, 1):
-                    if isinstance(match, tuple):  # Handle capturing groups
-                        match = match[0]
-                    result_text += f"<li>Match {i}: '{match}'</li>"
-                result_text += "</ul><h3>Highlighted Text:</h3>"
-                result_text += highlighted_text
+                    result.append(f"<li>Match {i}: '{match}'</li>")
+                result.append("</ul><h3>Highlighted Text:</h3>")
+                result.extend(highlighted)
+                result_text = ''.join(result)
             else:
                 result_text = "<h3>No matches found in the sample text.</h3>"
             
             self.test_results_edit.setHtml(result_text)
             
         except re.error as e:
-            self.test_results_edit.setHtml(f"<h3>Error in regular expression:</h3><p>{str(e)}</p>")
+            self.test_results_edit.setHtml(f"<h3>Error in regular expression:</h3><p>{html.escape(str(e))}</p>")
     
     def _import_rules(self) -> None:
         """Import rules from a JSON file."""
@@ -709,42 +967,60 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        # Read and parse the file in the background so large rule files
+        # don't stall the event loop
+        self._import_path = file_path
+        self.import_rules_button.setEnabled(False)
+        self.status_label.setText(f"Importing rules from {file_path}...")
+        
+        worker = Worker(read_terms_file, file_path)
+        worker.signals.finished.connect(self._apply_imported_rules)
+        worker.signals.failed.connect(self._import_rules_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(object)
+    def _apply_imported_rules(self, rules_data: Dict[str, Dict[str, str]]) -> None:
+        """
+        Add rules parsed by the import worker.
+        
+        Runs on the UI thread because it mutates the rules model.
+        
+        Args:
+            rules_data: Mapping of categories to rule names and patterns.
+        """
+        self.import_rules_button.setEnabled(True)
+        
         try:
-            import json
-            
-            with open(file_path, 'r') as f:
-                rules_data = json.load(f)
-            
-            # Validate the structure
-            if not isinstance(rules_data, dict):
-                raise ValueError("Invalid rule file format. Expected a JSON object.")
-            
             # Import the rules
-            if not self.redaction_engine.rule_manager.custom_terms_manager:
-                from python_redaction_system.storage.custom_terms import CustomTermsManager
-                from python_redaction_system.storage.database import DatabaseManager
-                
-                db_manager = DatabaseManager()
-                custom_terms_manager = CustomTermsManager(db_manager)
-                self.redaction_engine.rule_manager.custom_terms_manager = custom_terms_manager
+            self._ensure_custom_terms_manager()
             
-            # Add each rule
-            for category, rules in rules_data.items():
-                for rule_name, pattern in rules.items():
-                    self.redaction_engine.rule_manager.add_custom_rule(category, rule_name, pattern)
+            # Add all rules in one database transaction
+            self.redaction_engine.rule_manager.add_custom_rules(rules_data)
             
             # Refresh the table
-            self.rules_model.refresh()
+            self._refresh_rules_silently()
             
             # Refresh the category combo box
             self._refresh_category_combo()
             
             # Update status
-            self.status_label.setText(f"Rules imported from {file_path}")
+            self.status_label.setText(f"Rules imported from {self._import_path}")
             
         except Exception as e:
             QMessageBox.critical(self, "Import Error", f"Error importing rules: {str(e)}")
     
+    @Slot(str)
+    def _import_rules_failed(self, error: str) -> None:
+        """
+        Report a rule file that could not be read or parsed.
+        
+        Args:
+            error: The error message from the import worker.
+        """
+        self.import_rules_button.setEnabled(True)
+        self.status_label.setText("Ready")
+        QMessageBox.critical(self, "Import Error", f"Error importing rules: {error}")
+    
     def _export_rules(self) -> None:
         """Export custom rules to a JSON file."""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -763,9 +1039,7 @@ class MainWindow(QMainWindow):
             custom_terms = self.redaction_engine.rule_manager.custom_terms_manager.export_terms()
             
             # Export to JSON
-            import json
-            with open(file_path, 'w') as f:
-                json.dump(custom_terms, f, indent=4)
+            write_terms_file(custom_terms, file_path)
             
             # Update status
             self.status_label.setText(f"Rules exported to {file_path}")
@@ -787,27 +1061,8 @@ class MainWindow(QMainWindow):
         """
         if not hasattr(self, 'text_output'):
             return
-            
-        # Clear existing formatting
-        cursor = self.text_output.textCursor()
-        cursor.select(cursor.SelectionType.Document)
-        cursor.mergeCharFormat(QTextCharFormat())
         
-        if state == Qt.CheckState.Checked.value:
-            # Get the redacted text and positions
-            text = self.text_output.toPlainText()
-            redacted_positions = self.redaction_engine.get_last_redaction_positions()
-            
-            # Apply highlighting
-            for start, end in redacted_positions:
-                cursor = self.text_output.textCursor()
-                cursor.setPosition(start)
-                cursor.setPosition(end, cursor.MoveMode.KeepAnchor)
-                
-                format = QTextCharFormat()
-                format.setBackground(QColor(255, 255, 0, 100))  # Light yellow background
-                format.setForeground(QColor(0, 0, 0))  # Black text
-                cursor.mergeCharFormat(format)
+        self.output_highlighter.set_enabled(state == Qt.CheckState.Checked.value)
     
     def _toggle_split_view(self, state: int) -> None:
         """Toggle between normal and split view modes."""
@@ -826,17 +1081,78 @@ class MainWindow(QMainWindow):
         self.text_input.clear()
         self.text_output.clear()
     
+    def _set_category_selected(self, category: str, selected: bool) -> None:
+        """
+        Record a category checkbox being checked or unchecked.
+        
+        Args:
+            category: The category whose checkbox changed.
+            selected: Whether the checkbox is now checked.
+        """
+        if selected:
+            self._selected_categories.add(category)
+        else:
+            self._selected_categories.discard(category)
+    
+    def _input_text(self) -> str:
+        """
+        Get the input text, copying it out of the editor only when it changed.
+        
+        Returns:
+            The current contents of the input editor.
+        """
+        revision = self.text_input.document().revision()
+        text, cached_revision = self._cached_input
+        if cached_revision != revision:
+            text = self.text_input.toPlainText()
+            self._cached_input = (text, revision)
+        return text
+    
+    def _redact_cache_key(self, text: str, categories: List[str]) -> tuple:
+        """
+        Build the redaction cache key for a request.
+        
+        The rule manager's version is part of the key, so adding, importing or
+        removing rules makes older entries unreachable.
+        
+        Args:
+            text: The text to redact.
+            categories: The categories to redact.
+            
+        Returns:
+            A hashable key identifying the request.
+        """
+        return (
+            text,
+            frozenset(categories),
+            self.redaction_engine.sensitivity_level,
+            self.redaction_engine.rule_manager.version,
+        )
+    
+    def _remember_redaction(self, key: tuple, redacted_text: str, stats: Dict[str, int]) -> None:
+        """
+        Store a redaction result, evicting the least recently used one if full.
+        
+        Args:
+            key: The request's cache key.
+            redacted_text: The redacted text.
+            stats: The redaction statistics.
+        """
+        self._redact_cache[key] = (redacted_text, dict(stats))
+        if len(self._redact_cache) > _REDACT_CACHE_SIZE:
+            self._redact_cache.popitem(last=False)
+    
     def _redact_text(self) -> None:
         """Redact the input text and display the result."""
-        input_text = self.text_input.toPlainText()
+        input_text = self._input_text()
         if not input_text:
             QMessageBox.warning(self, "Warning", "No text to redact.")
             return
         
-        # Get selected categories
+        # Get selected categories, in checkbox order
         selected_categories = [
-            category for category, checkbox in self.category_checkboxes.items()
-            if checkbox.isChecked()
+            category for category in self.category_checkboxes
+            if category in self._selected_categories
         ]
         
         if not selected_categories:
@@ -846,57 +1162,102 @@ class MainWindow(QMainWindow):
         # Clear output before redacting
         self.text_output.clear()
         
-        # Add a loading indicator
+        # Results are only shown for the latest request
+        self._redact_request_id += 1
+        request_id = self._redact_request_id
+        
+        # Reuse the result of a recent identical request
+        key = self._redact_cache_key(input_text, selected_categories)
+        cached = self._redact_cache.get(key)
+        if cached is not None:
+            self._redact_cache.move_to_end(key)
+            redacted_text, stats = cached
+            self._show_redaction(selected_categories, redacted_text, dict(stats))
+            return
+        
+        # Add a loading indicator, in the status bar and the empty output view
         self.statusBar().showMessage("Redacting text...")
+        self.text_output.setPlaceholderText(_OUTPUT_BUSY_PLACEHOLDER)
         
-        # Perform redaction
+        # The engine is shared, so only one request runs at a time; loading
+        # a file is held off too, as it re-enables the redact button
+        self.redact_button.setEnabled(False)
+        self.load_file_button.setEnabled(False)
+        
+        # Run the engine in the background so large inputs don't freeze the UI
+        worker = Worker(self.redaction_engine.redact_text, input_text, selected_categories)
+        worker.signals.finished.connect(
+            lambda result: self._redaction_finished(request_id, key, selected_categories, result)
+        )
+        worker.signals.failed.connect(
+            lambda error: self._redaction_failed(request_id, error)
+        )
+        # The lambdas are only delivered while the worker's signals object is
+        # alive, so keep a reference to the latest worker
+        self._redact_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _redaction_finished(self, request_id: int, key: tuple, categories: List[str],
+                            result: Tuple[str, Dict[str, int]]) -> None:
+        """
+        Handle a result from the redaction worker.
+        
+        Args:
+            request_id: The id of the request the result belongs to.
+            key: The request's cache key.
+            categories: The categories that were redacted.
+            result: A tuple containing (redacted_text, statistics).
+        """
+        self.redact_button.setEnabled(True)
+        self.load_file_button.setEnabled(True)
+        
+        redacted_text, stats = result
+        self._remember_redaction(key, redacted_text, stats)
+        
+        # Drop results of requests that were superseded while running
+        if request_id != self._redact_request_id:
+            return
+        
+        self._show_redaction(categories, redacted_text, stats)
+    
+    def _redaction_failed(self, request_id: int, error: str) -> None:
+        """
+        Report an error raised by the redaction worker.
+        
+        Args:
+            request_id: The id of the request that failed.
+            error: The error message.
+        """
+        self.redact_button.setEnabled(True)
+        self.load_file_button.setEnabled(True)
+        
+        if request_id != self._redact_request_id:
+            return
+        
+        self.text_output.setPlaceholderText(_OUTPUT_PLACEHOLDER)
+        self.statusBar().showMessage("Error during redaction", 3000)
+        QMessageBox.critical(self, "Error", f"Error during redaction: {error}")
+        logging.error(f"Redaction error: {error}")
+    
+    def _show_redaction(self, categories: List[str], redacted_text: str, stats: Dict[str, int]) -> None:
+        """
+        Display a redaction result and its statistics.
+        
+        Args:
+            categories: The categories that were redacted.
+            redacted_text: The redacted text.
+            stats: The redaction statistics.
+        """
         try:
-            # Perform the redaction
-            redacted_text, stats = self.redaction_engine.redact_text(
-                input_text, selected_categories
-            )
+            self.text_output.setPlaceholderText(_OUTPUT_PLACEHOLDER)
             
-            # Store stats for displaying
-            self.redaction_stats = stats
-            
-            # Apply highlighting if enabled
-            if self.highlight_checkbox.isChecked():
-                # Use HTML with colored redaction markers
-                colored_text = redacted_text
-                
-                # Define colors for different categories
-                category_colors = {
-                    "PII": "#ff5555",       # Red
-                    "PHI": "#5555ff",       # Blue
-                    "FINANCIAL": "#55aa55", # Green
-                    "CREDENTIALS": "#aa55aa", # Purple
-                    "WORKPLACE": "#aaaa55",  # Yellow
-                    "LOCATIONS": "#55aaaa"  # Teal
-                }
-                
-                # Replace redaction markers with colored spans
-                for category in selected_categories:
-                    color = category_colors.get(category, "#aaaaaa")  # Default to gray
-                    # Pattern to match category markers like [PII:SSN]
-                    pattern = f'\\[{category}:[^\\]]+\\]'
-                    
-                    # Replace with colored versions
-                    colored_matches = []
-                    for match in re.finditer(pattern, colored_text):
-                        original = match.group(0)
-                        colored = f'<span style="background-color: {color}; color: white; padding: 1px 3px; border-radius: 2px; font-weight: bold;">{original}</span>'
-                        colored_matches.append((original, colored))
-                    
-                    # Apply replacements from longest to shortest to avoid issues
-                    colored_matches.sort(key=lambda x: len(x[0]), reverse=True)
-                    for original, colored in colored_matches:
-                        colored_text = colored_text.replace(original, colored)
-                
-                # Display with HTML formatting
-                self.text_output.setHtml(colored_text)
+            # Show the plain text; the highlighter colors the markers, and is
+            # given nothing to look for when nothing was redacted
+            if sum(stats.values()) > 0:
+                self.output_highlighter.set_categories(categories)
             else:
-                # Just use plain text
-                self.text_output.setPlainText(redacted_text)
+                self.output_highlighter.set_categories([])
+            self.text_output.setPlainText(redacted_text)
             
             # Clear status message
             self.statusBar().showMessage("Redaction complete", 3000)
@@ -907,15 +1268,18 @@ class MainWindow(QMainWindow):
             # Make sure the output is visible by adjusting splitter if needed
             sizes = self.main_splitter.sizes()
             total = sum(sizes)
-            # Give more space to the output (40/60 split)
-            self.main_splitter.setSizes([int(total * 0.4), int(total * 0.6)])
+            # Give more space to the output (40/60 split), skipping the
+            # relayout when the splitter is already there
+            target_sizes = [int(total * 0.4), int(total * 0.6)]
+            if sizes != target_sizes:
+                self.main_splitter.setSizes(target_sizes)
             
-            # Update statistics display
+            # Update statistics display; this also stores the stats
             try:
                 self._update_statistics(stats)
                 
                 # Optionally show the statistics tab (could also be controlled by a setting)
-                if self.auto_show_stats_checkbox.isChecked():
+                if self.auto_show_stats_checkbox.isChecked() and self.tab_widget.currentIndex() != 2:
                     self.tab_widget.setCurrentIndex(2)  # Switch to Statistics tab (index 2)
                 
             except Exception as stats_error:
@@ -934,18 +1298,51 @@ class MainWindow(QMainWindow):
             self, "Open Text File", "", "Text Files (*.txt);;All Files (*)"
         )
         
-        if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    self.text_input.setPlainText(file.read())
-                self.status_label.setText(f"Loaded text from {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error loading file: {str(e)}")
+        if not file_path:
+            return
+        
+        # Read the file in the background so large files don't freeze the UI;
+        # redacting is held off until the new input is in place
+        self._load_path = file_path
+        self.load_file_button.setEnabled(False)
+        self.redact_button.setEnabled(False)
+        self.status_label.setText(f"Loading text from {file_path}...")
+        
+        worker = Worker(_read_text_file, file_path)
+        worker.signals.finished.connect(self._apply_loaded_text)
+        worker.signals.failed.connect(self._load_from_file_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(object)
+    def _apply_loaded_text(self, text: str) -> None:
+        """
+        Show text read by the file loading worker.
+        
+        Args:
+            text: The contents of the loaded file.
+        """
+        self.load_file_button.setEnabled(True)
+        self.redact_button.setEnabled(True)
+        self.text_input.setPlainText(text)
+        self.status_label.setText(f"Loaded text from {self._load_path}")
+    
+    @Slot(str)
+    def _load_from_file_failed(self, error: str) -> None:
+        """
+        Report a text file that could not be read.
+        
+        Args:
+            error: The error message from the file loading worker.
+        """
+        self.load_file_button.setEnabled(True)
+        self.redact_button.setEnabled(True)
+        self.status_label.setText("Ready")
+        QMessageBox.critical(self, "Error", f"Error loading file: {error}")
     
     def _save_to_file(self) -> None:
         """Save redacted text to a file."""
-        output_text = self.text_output.toPlainText()
-        if not output_text:
+        document = self.text_output.document()
+        if document.isEmpty():
             QMessageBox.warning(self, "Warning", "No redacted text to save.")
             return
         
@@ -955,8 +1352,16 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(output_text)
+                # Write block by block rather than copying the whole
+                # document into one string first
+                with open(file_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as file:
+                    block = document.firstBlock()
+                    file.write(block.text().translate(_PLAIN_TEXT_TABLE))
+                    block = block.next()
+                    while block.isValid():
+                        file.write('\n')
+                        file.write(block.text().translate(_PLAIN_TEXT_TABLE))
+                        block = block.next()
                 self.status_label.setText(f"Saved redacted text to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error saving file: {str(e)}")
@@ -971,64 +1376,80 @@ class MainWindow(QMainWindow):
         # Store the stats for potential export
         self.redaction_stats = stats
         
-        # Clear previous stats
-        for i in range(self.stats_table.rowCount()):
-            self.stats_table.removeRow(0)
-            
+        # The statistics tab shows the stored stats when it is first built
+        if not self._tabs_built[2]:
+            return
+        
         # Exit if no stats
         if not stats:
+            self.stats_table.setRowCount(0)
             self.stats_summary_label.setText("No redactions performed yet.")
             return
+        
+        # Size the table once (categories plus the total row) and fill the
+        # existing cells instead of removing and inserting every row
+        rows = sorted(stats.items())
+        self.stats_table.setUpdatesEnabled(False)
+        try:
+            self.stats_table.setRowCount(len(rows) + 1)
             
-        # Add data to table
-        row = 0
-        total_redacted = 0
-        for category, count in sorted(stats.items()):
-            self.stats_table.insertRow(row)
-            
-            # Category name
-            category_item = QTableWidgetItem(category)
-            category_item.setFlags(category_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.stats_table.setItem(row, 0, category_item)
-            
-            # Count
-            count_item = QTableWidgetItem(str(count))
-            count_item.setFlags(count_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            count_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.stats_table.setItem(row, 1, count_item)
-            
-            # Track total
-            total_redacted += count
-            row += 1
+            # Add data to table
+            total_redacted = 0
+            for row, (category, count) in enumerate(rows):
+                self._set_statistics_row(row, category, count, None)
+                
+                # Track total
+                total_redacted += count
+                
+            # Add total row
+            self._set_statistics_row(len(rows), "TOTAL", total_redacted, self._stats_total_font)
             
-        # Add total row
-        self.stats_table.insertRow(row)
-        total_label = QTableWidgetItem("TOTAL")
-        total_label.setFlags(total_label.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        total_label.setFont(QFont("Arial", weight=QFont.Weight.Bold))
-        self.stats_table.setItem(row, 0, total_label)
-        
-        total_count = QTableWidgetItem(str(total_redacted))
-        total_count.setFlags(total_count.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        total_count.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        total_count.setFont(QFont("Arial", weight=QFont.Weight.Bold))
-        self.stats_table.setItem(row, 1, total_count)
-        
-        # Resize columns to content
-        self.stats_table.resizeColumnsToContents()
+            # Resize columns to content once control returns to the event
+            # loop, so back-to-back updates share a single resize
+            self._stats_resize_timer.start()
+        finally:
+            self.stats_table.setUpdatesEnabled(True)
         
         # Update stats label
         self.stats_summary_label.setText(f"Redaction Statistics: {total_redacted} items redacted")
 
+    def _set_statistics_row(self, row: int, label: str, count: int, font: Optional[QFont]) -> None:
+        """
+        Fill one statistics table row, reusing its items when they already exist.
+        
+        Args:
+            row: The row to fill.
+            label: The text for the category column.
+            count: The value for the count column.
+            font: Font for both cells, or None for the table's default font.
+        """
+        label_item = self.stats_table.item(row, 0)
+        count_item = self.stats_table.item(row, 1)
+        if label_item is None:
+            label_item = QTableWidgetItem()
+            label_item.setFlags(label_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.stats_table.setItem(row, 0, label_item)
+        if count_item is None:
+            count_item = QTableWidgetItem()
+            count_item.setFlags(count_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            count_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.stats_table.setItem(row, 1, count_item)
+        
+        label_item.setText(label)
+        count_item.setText(str(count))
+        # A None font clears the role so the cell falls back to the table font
+        label_item.setData(Qt.ItemDataRole.FontRole, font)
+        count_item.setData(Qt.ItemDataRole.FontRole, font)
+    
     def _copy_to_clipboard(self) -> None:
         """Copy the redacted text to the clipboard."""
-        text = self.text_output.toPlainText()
-        if not text:
+        # Check for an empty document before copying its text out
+        if self.text_output.document().isEmpty():
             QMessageBox.warning(self, "Warning", "No redacted text to copy.")
             return
             
         clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        clipboard.setText(self.text_output.toPlainText())
         
         # Provide feedback by temporarily changing the button text
         original_text = self.copy_output_button.text()
@@ -1061,6 +1482,15 @@ class MainWindow(QMainWindow):
         self.stats_table.verticalHeader().setVisible(False)
         layout.addWidget(self.stats_table)
         
+        # Font for the TOTAL row, shared by every statistics refresh
+        self._stats_total_font = QFont("Arial", weight=QFont.Weight.Bold)
+        
+        # Deferred column resize after statistics updates
+        self._stats_resize_timer = QTimer(self)
+        self._stats_resize_timer.setSingleShot(True)
+        self._stats_resize_timer.setInterval(0)
+        self._stats_resize_timer.timeout.connect(self.stats_table.resizeColumnsToContents)
+        
         # Buttons for statistics
         button_layout = QHBoxLayout()
         
@@ -1081,13 +1511,16 @@ class MainWindow(QMainWindow):
         
         # Add stretch to push content to the top
         layout.addStretch()
+        
+        # Show any statistics gathered before the tab was opened
+        if self.redaction_stats:
+            self._update_statistics(self.redaction_stats)
     
     def _clear_statistics(self) -> None:
         """Clear the statistics display."""
         # Clear the table
-        for i in range(self.stats_table.rowCount()):
-            self.stats_table.removeRow(0)
-            
+        self.stats_table.setRowCount(0)
+        
         # Reset the label
         self.stats_summary_label.setText("No redactions performed yet.")
         
@@ -1106,18 +1539,16 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
+                rows = sorted(self.redaction_stats.items())
                 with open(file_path, 'w', encoding='utf-8') as file:
-                    # Write header
-                    file.write("Category,Count\n")
-                    
-                    # Write data
-                    total = 0
-                    for category, count in sorted(self.redaction_stats.items()):
-                        file.write(f"{category},{count}\n")
-                        total += count
+                    # csv quotes category names that contain commas or quotes;
+                    # '\n' keeps the platform's line endings as before
+                    writer = csv.writer(file, lineterminator='\n')
                     
-                    # Write total
-                    file.write(f"TOTAL,{total}\n")
+                    # Write header, data and total
+                    writer.writerow(("Category", "Count"))
+                    writer.writerows(rows)
+                    writer.writerow(("TOTAL", sum(count for _, count in rows)))
                     
                 self.status_label.setText(f"Statistics exported to {file_path}")
             except Exception as e:
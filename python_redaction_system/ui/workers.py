@@ -0,0 +1,53 @@
+"""
+Background workers for running blocking operations off the UI thread.
+"""
+
+import logging
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker.
+    
+    QRunnable is not a QObject, so signals live on this helper object. It is
+    created on the UI thread, which makes connected slots run there as well.
+    """
+    
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class Worker(QRunnable):
+    """
+    Runs a callable on a QThreadPool thread and reports the outcome via signals.
+    """
+    
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        """
+        Initialize the worker.
+        
+        Args:
+            fn: The callable to run in the background.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self) -> None:
+        """Run the callable and emit its result or error message."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error("Background task failed: %s", e)
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
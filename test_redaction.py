@@ -12,18 +12,19 @@ from python_redaction_system.core.redaction_engine import RedactionEngine
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 def test_redaction():
     """Test redaction functionality."""
-    print(f"Running with Python {sys.version}")
+    logger.info("Running with Python %s", sys.version)
     
     # Create redaction engine
-    print("\nInitializing redaction engine...")
+    logger.info("Initializing redaction engine...")
     rule_manager = RuleManager()
     engine = RedactionEngine(rule_manager)
     
-    # Print available methods
-    print(f"\nAvailable redaction methods: {[m.value for m in engine.available_methods]}")
+    # Log available methods
+    logger.info("Available redaction methods: %s", [m.value for m in engine.available_methods])
     
     # Test sample text
     sample_text = """
@@ -32,23 +33,22 @@ def test_redaction():
     I live at 123 Main St, New York, NY 10001.
     """
     
-    print("\nOriginal text:")
-    print(sample_text)
-    
     # Try redaction
-    print("\nRedacted text:")
     redacted_text, stats = engine.redact_text(sample_text)
-    print(redacted_text)
     
-    # Print stats
-    print("\nRedaction statistics:")
-    print(stats)
+    # Write the original, redacted text and stats in one call instead of
+    # six separate prints
+    sys.stdout.write(
+        f"\nOriginal text:\n{sample_text}\n"
+        f"\nRedacted text:\n{redacted_text}\n"
+        f"\nRedaction statistics:\n{stats}\n"
+    )
     
     # Try analysis
-    print("\nText analysis:")
+    logger.info("Text analysis:")
     analysis = engine.analyze_text(sample_text)
     for category, items in analysis.items():
-        print(f"{category}: {items}")
+        logger.info("%s: %s", category, items)
 
 if __name__ == "__main__":
     test_redaction() 
\ No newline at end of file